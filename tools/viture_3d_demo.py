@@ -3,6 +3,10 @@
 Viture 3D Demo Scene
 
 An impressive stereo 3D demo with multiple objects at different depths.
+
+Requirements: pip install PySDL2 PyOpenGL PyOpenGL_accelerate numpy
+
+Set VITURE_PROFILE=1 to print per-stage GPU times next to the FPS.
 """
 
 import sys
@@ -12,14 +16,16 @@ import time
 import ctypes
 import subprocess
 import random
+import re
+import functools
 
+@functools.lru_cache(maxsize=None)
 def get_viture_position():
-    """Get Viture display position from xrandr"""
+    """Get Viture display position from xrandr (queried once, on first use)"""
     try:
         result = subprocess.run(['xrandr', '--listmonitors'], capture_output=True, text=True)
         for line in result.stdout.split('\n'):
             if 'HDMI-1' in line or 'HDMI-A-1' in line:
-                import re
                 match = re.search(r'\+(\d+)\+(\d+)', line)
                 if match:
                     x, y = int(match.group(1)), int(match.group(2))
@@ -29,9 +35,6 @@ def get_viture_position():
         print(f"Warning: Could not get xrandr info: {e}")
     return 2560, 0
 
-VITURE_X, VITURE_Y = get_viture_position()
-os.environ['SDL_VIDEO_WINDOW_POS'] = f'{VITURE_X},{VITURE_Y}'
-
 try:
     import sdl2
     import sdl2.ext
@@ -40,59 +43,293 @@ except ImportError:
     sys.exit(1)
 
 try:
+    import OpenGL
+    # Skip per-call glGetError and argument checks; set before importing OpenGL.GL
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
     from OpenGL.GL import *
-    from OpenGL.GLU import *
 except ImportError:
-    print("PyOpenGL not found. Install with: pip install PyOpenGL")
+    print("PyOpenGL not found. Install with: pip install PyOpenGL PyOpenGL_accelerate")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("NumPy not found. Install with: pip install numpy")
+    sys.exit(1)
 
-class Star:
-    """A star in the starfield"""
-    def __init__(self):
-        self.reset()
-        self.z = random.uniform(1, 100)  # Start at random depth
-    
-    def reset(self):
-        self.x = random.uniform(-50, 50)
-        self.y = random.uniform(-30, 30)
-        self.z = 100
-        self.speed = random.uniform(0.5, 2.0)
-    
-    def update(self, dt):
-        self.z -= self.speed * dt * 30
-        if self.z < 1:
-            self.reset()
-
-
-class FloatingObject:
-    """A floating 3D object with Z movement"""
-    def __init__(self, obj_type, x, y, z, color, size=1.0):
-        self.type = obj_type  # 'cube', 'sphere', 'torus'
-        self.x = x
-        self.y = y
-        self.z_base = z  # Base Z position
-        self.z = z
-        self.color = color
-        self.size = size
-        self.rot_x = random.uniform(0, 360)
-        self.rot_y = random.uniform(0, 360)
-        self.rot_speed_x = random.uniform(-50, 50)
-        self.rot_speed_y = random.uniform(-50, 50)
-        self.bob_offset = random.uniform(0, math.pi * 2)
-        self.bob_speed = random.uniform(0.5, 1.5)
+
+def build_cube_vertices():
+    """Unit cube as 36 (x, y, z) vertices for GL_TRIANGLES"""
+    s = 0.5
+    faces = [
+        [(-s, -s, s), (s, -s, s), (s, s, s), (-s, s, s)],      # Front
+        [(s, -s, -s), (-s, -s, -s), (-s, s, -s), (s, s, -s)],  # Back
+        [(-s, -s, -s), (-s, -s, s), (-s, s, s), (-s, s, -s)],  # Left
+        [(s, -s, s), (s, -s, -s), (s, s, -s), (s, s, s)],      # Right
+        [(-s, s, s), (s, s, s), (s, s, -s), (-s, s, -s)],      # Top
+        [(-s, -s, -s), (s, -s, -s), (s, -s, s), (-s, -s, s)],  # Bottom
+    ]
+    # Each quad (counter-clockwise from outside) becomes two triangles
+    return np.array([quad[k] for quad in faces for k in (0, 1, 2, 0, 2, 3)], dtype=np.float32)
+
+
+def build_cube_edges():
+    """The 12 edges of the unit cube as 24 (x, y, z) vertices for GL_LINES"""
+    s = 0.5
+    verts = []
+    for i in [-1, 1]:
+        for j in [-1, 1]:
+            verts += [(i*s, j*s, -s), (i*s, j*s, s)]
+            verts += [(i*s, -s, j*s), (i*s, s, j*s)]
+            verts += [(-s, i*s, j*s), (s, i*s, j*s)]
+    return np.array(verts, dtype=np.float32)
+
+
+def build_floor_grid():
+    """Floor grid as interleaved (x, y, z, r, g, b, a) vertices for GL_LINES"""
+    y = -5
+    verts = []
+    for i in range(-20, 21, 2):
+        # Fade with distance
+        alpha = max(0, 1.0 - abs(i) / 25.0)
+        color = (0.2, 0.4, 0.6, alpha * 0.5)
+        verts += [(i, y, -5) + color, (i, y, -100) + color]
+    
+    for z in range(-100, 0, 5):
+        alpha = max(0, 1.0 - abs(z) / 100.0)
+        color = (0.2, 0.4, 0.6, alpha * 0.5)
+        verts += [(-20, y, z) + color, (20, y, z) + color]
+    return np.array(verts, dtype=np.float32)
+
+
+# Bounding sphere radius of the unit cube, scaled by each cube's size
+CUBE_RADIUS = math.sqrt(3) / 2
+
+# Wireframe edges only help depth perception up close
+EDGE_MAX_DISTANCE = 20.0
+
+# Star respawn ranges for (x, y, speed), drawn STAR_RESET_POOL rows at a time
+STAR_RESET_LOW = (-50, -30, 0.5)
+STAR_RESET_HIGH = (50, 30, 2.0)
+STAR_RESET_POOL = 1024
+
+# Render stages timed with GL_TIME_ELAPSED queries when VITURE_PROFILE=1
+GPU_STAGES = ('clear', 'draw_left', 'draw_right')
+
+# Simulation runs at a fixed 120 Hz step, decoupled from the render rate
+SIM_DT = 1.0 / 120
+MAX_FRAME_TIME = 0.25
+
+# Vertex attribute locations shared by all shader programs
+ATTRIB_POSITION = 0
+ATTRIB_COLOR = 1
+
+# Lines and triangles: per-vertex color, or a constant one set with glVertexAttrib4f
+MESH_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec4 aColor;
+uniform mat4 uMVP;
+out vec4 vColor;
+void main() {
+    vColor = aColor;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+}
+"""
+
+# Stars: same as the mesh shader, with nearer points drawn larger (1-3 px)
+POINT_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec4 aColor;
+uniform mat4 uMVP;
+out vec4 vColor;
+void main() {
+    vColor = aColor;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+    gl_PointSize = clamp(100.0 / -aPos.z, 1.0, 3.0);
+}
+"""
+
+COLOR_FRAGMENT_SHADER = """
+#version 330 core
+in vec4 vColor;
+out vec4 fragColor;
+void main() {
+    fragColor = vColor;
+}
+"""
+
+
+def compile_shader(kind, source):
+    shader = glCreateShader(kind)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        raise RuntimeError(f"Shader compilation failed: {glGetShaderInfoLog(shader).decode()}")
+    return shader
+
+
+def compile_program(vertex_source, fragment_source):
+    shaders = [compile_shader(GL_VERTEX_SHADER, vertex_source),
+               compile_shader(GL_FRAGMENT_SHADER, fragment_source)]
+    program = glCreateProgram()
+    for shader in shaders:
+        glAttachShader(program, shader)
+    glLinkProgram(program)
+    for shader in shaders:
+        glDeleteShader(shader)
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        raise RuntimeError(f"Shader link failed: {glGetProgramInfoLog(program).decode()}")
+    return program
+
+
+def rotation_matrices(angles, axis):
+    """Stack of 3x3 rotations by angles (degrees) about a shared axis, like glRotatef"""
+    x, y, z = np.asarray(axis, np.float64) / np.linalg.norm(axis)
+    theta = np.radians(angles)[:, None, None]
+    cross = np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    outer = np.outer((x, y, z), (x, y, z))
+    return np.cos(theta) * np.eye(3) + np.sin(theta) * cross + (1 - np.cos(theta)) * outer
+
+
+def perspective(fov, aspect, near, far):
+    """Row-major 4x4 perspective projection, same as gluPerspective"""
+    f = 1.0 / math.tan(math.radians(fov) / 2)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0],
+    ])
+
+
+def translation(x, y, z):
+    m = np.eye(4)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def rotation_x(angle):
+    """Row-major 4x4 rotation by angle degrees about X, same as glRotatef(angle, 1, 0, 0)"""
+    c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return np.array([[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]])
+
+
+def rotation_y(angle):
+    """Row-major 4x4 rotation by angle degrees about Y, same as glRotatef(angle, 0, 1, 0)"""
+    c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    return np.array([[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]])
+
+
+def frustum_planes(clip):
+    """Normalized (a, b, c, d) frustum planes of a 4x4 clip matrix (Gribb-Hartmann)"""
+    planes = np.array([
+        clip[3] + clip[0], clip[3] - clip[0],  # Left, right
+        clip[3] + clip[1], clip[3] - clip[1],  # Bottom, top
+        clip[3] + clip[2], clip[3] - clip[2],  # Near, far
+    ])
+    return planes / np.linalg.norm(planes[:, :3], axis=1)[:, None]
+
+
+def spheres_in_frustum(planes, centers, radii):
+    """Mask of the bounding spheres (N x 3 centers, N radii) not fully outside any plane"""
+    distances = centers @ planes[:, :3].T + planes[:, 3]
+    return np.all(distances >= -radii[:, None], axis=1)
+
+
+def make_starfield(count):
+    """Starfield as a dict of float32 columns (x, y, z, speed)"""
+    return dict(
+        x=np.random.uniform(-50, 50, count).astype(np.float32),
+        y=np.random.uniform(-30, 30, count).astype(np.float32),
+        z=np.random.uniform(1, 100, count).astype(np.float32),  # Start at random depth
+        speed=np.random.uniform(0.5, 2.0, count).astype(np.float32),
+    )
+
+
+class FloatingObjects:
+    """Floating 3D objects with Z movement, stored as one NumPy column per attribute"""
+    def __init__(self, capacity):
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.z_base = np.zeros(capacity)  # Base Z position
+        self.z = np.zeros(capacity)
+        self.y_offset = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3))
+        self.size = np.ones(capacity)
+        self.rot_x = np.zeros(capacity)
+        self.rot_y = np.zeros(capacity)
+        self.rot_speed_x = np.zeros(capacity)
+        self.rot_speed_y = np.zeros(capacity)
+        self.bob_offset = np.zeros(capacity)
+        self.bob_speed = np.zeros(capacity)
         # Z oscillation parameters
-        self.z_amplitude = z * 0.4  # Move 40% of base distance
-        self.z_speed = random.uniform(0.3, 0.7)
-        self.z_phase = random.uniform(0, math.pi * 2)
+        self.z_amplitude = np.zeros(capacity)
+        self.z_speed = np.zeros(capacity)
+        self.z_phase = np.zeros(capacity)
+    
+    def __len__(self):
+        return self.count
+    
+    def _grow(self):
+        """Double the capacity of every column, keeping the objects already stored"""
+        for name, column in list(vars(self).items()):
+            if isinstance(column, np.ndarray):
+                extra = np.zeros((max(len(column), 1),) + column.shape[1:], column.dtype)
+                setattr(self, name, np.concatenate((column, extra)))
+    
+    def add(self, x, y, z, color, size=1.0):
+        """Append an object with randomized motion, returns its index"""
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.z_base[i] = z
+        self.z[i] = z
+        self.color[i] = color
+        self.size[i] = size
+        self.rot_x[i] = random.uniform(0, 360)
+        self.rot_y[i] = random.uniform(0, 360)
+        self.rot_speed_x[i] = random.uniform(-50, 50)
+        self.rot_speed_y[i] = random.uniform(-50, 50)
+        self.bob_offset[i] = random.uniform(0, math.pi * 2)
+        self.bob_speed[i] = random.uniform(0.5, 1.5)
+        self.z_amplitude[i] = z * 0.4  # Move 40% of base distance
+        self.z_speed[i] = random.uniform(0.3, 0.7)
+        self.z_phase[i] = random.uniform(0, math.pi * 2)
+        return i
+    
+    def model_matrices(self):
+        """(count, 4, 4) model matrices T(x, y + y_offset, -z) @ Rx(rot_x) @ Ry(rot_y) @ S(size)"""
+        n = self.count
+        ax, ay = np.radians(self.rot_x[:n]), np.radians(self.rot_y[:n])
+        cx, sx, cy, sy = np.cos(ax), np.sin(ax), np.cos(ay), np.sin(ay)
+        size = self.size[:n]
+        
+        m = np.zeros((n, 4, 4))
+        m[:, 0, 0], m[:, 0, 1], m[:, 0, 2] = cy * size, 0, sy * size
+        m[:, 1, 0], m[:, 1, 1], m[:, 1, 2] = sx * sy * size, cx * size, -sx * cy * size
+        m[:, 2, 0], m[:, 2, 1], m[:, 2, 2] = -cx * sy * size, sx * size, cx * cy * size
+        m[:, 0, 3] = self.x[:n]
+        m[:, 1, 3] = self.y[:n] + self.y_offset[:n]
+        m[:, 2, 3] = -self.z[:n]
+        m[:, 3, 3] = 1
+        return m
     
     def update(self, dt, time_s):
-        self.rot_x += self.rot_speed_x * dt
-        self.rot_y += self.rot_speed_y * dt
+        n = self.count
+        self.rot_x[:n] += self.rot_speed_x[:n] * dt
+        self.rot_y[:n] += self.rot_speed_y[:n] * dt
         # Gentle bobbing Y
-        self.y_offset = math.sin(time_s * self.bob_speed + self.bob_offset) * 0.3
+        self.y_offset[:n] = np.sin(time_s * self.bob_speed[:n] + self.bob_offset[:n]) * 0.3
         # Z oscillation - moves toward and away from viewer
-        self.z = self.z_base + math.sin(time_s * self.z_speed + self.z_phase) * self.z_amplitude
+        self.z[:n] = self.z_base[:n] + np.sin(time_s * self.z_speed[:n] + self.z_phase[:n]) * self.z_amplitude[:n]
 
 
 class Demo3DScene:
@@ -103,21 +340,51 @@ class Demo3DScene:
         self.height = 1080
         self.eye_width = self.width // 2
         self.running = True
+        self.profile = os.environ.get('VITURE_PROFILE') == '1'
+        self.events = (sdl2.SDL_Event * 16)()
         self.ipd = 0.070  # Back to realistic: 70mm
         self.near = 0.1
         self.far = 200.0
         self.fov = 55.0
+        self._projection = None
+        self._projection_key = None
+        self._eye_view_projs = {}
+        self._eye_ipd = None
         
         # Scene objects
-        self.stars = [Star() for _ in range(200)]
-        self.objects = [
-            # Single cube that moves dramatically in Z - from very close to far
-            FloatingObject('cube', 0, 0, 15, (1, 0.5, 0.2), 2.0),
-        ]
+        self.num_stars = 200
+        self.stars = make_starfield(self.num_stars)
+        # Respawned stars draw from a batch of random values instead of per-reset calls
+        self._rng = np.random.default_rng()
+        self._reset_pool = np.empty((0, 3), np.float32)
+        self._reset_i = 0
+        self.star_pos = np.zeros((self.num_stars, 3), np.float32)
+        self.star_col = np.zeros((self.num_stars, 3), np.float32)
+        self.objects = FloatingObjects(1)
+        # Single cube that moves dramatically in Z - from very close to far
+        cube = self.objects.add(0, 0, 15, (1, 0.5, 0.2), 2.0)
         # Override Z movement for dramatic effect
-        self.objects[0].z_amplitude = 12  # Moves from z=3 to z=27
-        self.objects[0].z_speed = 0.25  # Slow for observation
-        self.objects[0].z_phase = 0
+        self.objects.z_amplitude[cube] = 12  # Moves from z=3 to z=27
+        self.objects.z_speed[cube] = 0.25  # Slow for observation
+        self.objects.z_phase[cube] = 0
+        self.scene_time = 0.0
+        
+        # Fixed ring positions (radius 5, every 45 degrees); the ring's spin is part of its model matrix
+        ring_angles = [math.radians(i * 45) for i in range(8)]
+        self.ring_centers = np.array([(math.cos(a) * 5, 0, math.sin(a) * 5) for a in ring_angles],
+                                     dtype=np.float32)
+        self.ring_radii = np.full(8, 0.8 * CUBE_RADIUS, np.float32)
+        
+        # The ring's 8 cubes are pre-transformed on the CPU into one streamed buffer
+        # of interleaved (x, y, z, r, g, b) vertices, one slice of 36 per cube
+        self.ring_cube = build_cube_vertices() * 0.8
+        self.ring_verts = np.zeros((8, len(self.ring_cube), 6), np.float32)
+        self.ring_firsts = np.arange(8, dtype=np.int32) * len(self.ring_cube)
+        self.ring_counts = np.full(8, len(self.ring_cube), np.int32)
+        
+        # Rainbow lookup table for the ring, indexed by hue * 256
+        self.rainbow = np.array([self.hsv_to_rgb(h / 256.0, 0.8, 1.0) for h in range(256)],
+                                dtype=np.float32)
         
         self._init_sdl()
         self._init_gl()
@@ -126,18 +393,21 @@ class Demo3DScene:
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
             raise RuntimeError(f"SDL_Init failed: {sdl2.SDL_GetError()}")
         
-        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MAJOR_VERSION, 2)
-        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MINOR_VERSION, 1)
+        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MAJOR_VERSION, 3)
+        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MINOR_VERSION, 3)
         sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_PROFILE_MASK, 
-                                  sdl2.SDL_GL_CONTEXT_PROFILE_COMPATIBILITY)
+                                  sdl2.SDL_GL_CONTEXT_PROFILE_CORE)
         sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_DOUBLEBUFFER, 1)
         sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_DEPTH_SIZE, 24)
         
         flags = sdl2.SDL_WINDOW_OPENGL | sdl2.SDL_WINDOW_SHOWN | sdl2.SDL_WINDOW_BORDERLESS
         
+        viture_x, viture_y = get_viture_position()
+        os.environ['SDL_VIDEO_WINDOW_POS'] = f'{viture_x},{viture_y}'
+        
         self.window = sdl2.SDL_CreateWindow(
             b"Viture 3D Demo",
-            VITURE_X, VITURE_Y,
+            viture_x, viture_y,
             self.width, self.height,
             flags
         )
@@ -145,13 +415,15 @@ class Demo3DScene:
         if not self.window:
             raise RuntimeError(f"SDL_CreateWindow failed: {sdl2.SDL_GetError()}")
         
-        sdl2.SDL_SetWindowPosition(self.window, VITURE_X, VITURE_Y)
+        sdl2.SDL_SetWindowPosition(self.window, viture_x, viture_y)
         
         self.gl_context = sdl2.SDL_GL_CreateContext(self.window)
         if not self.gl_context:
             raise RuntimeError(f"SDL_GL_CreateContext failed: {sdl2.SDL_GetError()}")
         
-        sdl2.SDL_GL_SetSwapInterval(1)
+        # Adaptive vsync lets a late frame tear instead of waiting a whole refresh
+        if sdl2.SDL_GL_SetSwapInterval(-1) != 0:
+            sdl2.SDL_GL_SetSwapInterval(1)
         
         actual_x, actual_y = ctypes.c_int(), ctypes.c_int()
         sdl2.SDL_GetWindowPosition(self.window, ctypes.byref(actual_x), ctypes.byref(actual_y))
@@ -161,167 +433,260 @@ class Demo3DScene:
         glClearColor(0.0, 0.0, 0.02, 1.0)
         glEnable(GL_DEPTH_TEST)
         glDepthFunc(GL_LEQUAL)
-        glEnable(GL_BLEND)
+        # Cube faces are wound counter-clockwise seen from outside
+        glEnable(GL_CULL_FACE)
+        glCullFace(GL_BACK)
+        glFrontFace(GL_CCW)
+        # Blending is only enabled around the translucent floor grid
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glEnable(GL_POINT_SMOOTH)
-        glHint(GL_POINT_SMOOTH_HINT, GL_NICEST)
+        glEnable(GL_PROGRAM_POINT_SIZE)
+        
+        self.mesh_program = compile_program(MESH_VERTEX_SHADER, COLOR_FRAGMENT_SHADER)
+        self.point_program = compile_program(POINT_VERTEX_SHADER, COLOR_FRAGMENT_SHADER)
+        self.mesh_mvp = glGetUniformLocation(self.mesh_program, "uMVP")
+        self.point_mvp = glGetUniformLocation(self.point_program, "uMVP")
+        
+        # Static cube geometry, uploaded once and drawn with glDrawArrays
+        self.cube_vbo, self.cube_edge_vbo = glGenBuffers(2)
+        self.cube_vertex_count = self._upload_static(self.cube_vbo, build_cube_vertices())
+        self.cube_edge_count = self._upload_static(self.cube_edge_vbo, build_cube_edges())
+        self.grid_vbo = glGenBuffers(1)
+        self.grid_vertex_count = self._upload_static(self.grid_vbo, build_floor_grid())
+        
+        # Starfield buffers, refilled once per frame with glBufferSubData
+        self.star_vbo_pos, self.star_vbo_col = glGenBuffers(2)
+        for vbo, data in ((self.star_vbo_pos, self.star_pos), (self.star_vbo_col, self.star_col)):
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, data.nbytes, None, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self.ring_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.ring_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.ring_verts.nbytes, None, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        # One VAO per drawable: (vbo, attribute, components, stride, offset)
+        self.cube_vao = self._make_vao((self.cube_vbo, ATTRIB_POSITION, 3, 0, 0))
+        self.cube_edge_vao = self._make_vao((self.cube_edge_vbo, ATTRIB_POSITION, 3, 0, 0))
+        self.grid_vao = self._make_vao((self.grid_vbo, ATTRIB_POSITION, 3, 28, 0),
+                                       (self.grid_vbo, ATTRIB_COLOR, 4, 28, 12))
+        self.star_vao = self._make_vao((self.star_vbo_pos, ATTRIB_POSITION, 3, 0, 0),
+                                       (self.star_vbo_col, ATTRIB_COLOR, 3, 0, 0))
+        self.ring_vao = self._make_vao((self.ring_vbo, ATTRIB_POSITION, 3, 24, 0),
+                                       (self.ring_vbo, ATTRIB_COLOR, 3, 24, 12))
+        
+        # GPU time per render stage, only when VITURE_PROFILE=1
+        if self.profile:
+            self.gpu_queries = dict(zip(GPU_STAGES, glGenQueries(len(GPU_STAGES))))
+            self.gpu_stage = None
         
         print(f"OpenGL: {glGetString(GL_VERSION).decode()}")
         print(f"GPU: {glGetString(GL_RENDERER).decode()}")
     
+    def _upload_static(self, vbo, data):
+        """Upload a float32 vertex array into a static VBO, returns the vertex count"""
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return len(data)
+    
+    def _make_vao(self, *attribs):
+        """Build a VAO from (vbo, location, size, stride, offset) float attribute layouts"""
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+        for vbo, location, size, stride, offset in attribs:
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(offset))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vao
+    
+    def _set_mvp(self, location, mvp):
+        glUniformMatrix4fv(location, 1, GL_TRUE, np.ascontiguousarray(mvp, np.float32))
+    
+    def projection(self):
+        """Perspective matrix for one eye, rebuilt only when fov or eye size change"""
+        key = (self.fov, self.eye_width, self.height, self.near, self.far)
+        if key != self._projection_key:
+            self._projection = perspective(self.fov, self.eye_width / self.height, self.near, self.far)
+            self._projection_key = key
+            self._eye_view_projs.clear()
+        return self._projection
+    
     def set_stereo_projection(self, eye='left'):
         """Simple parallel stereo projection for SBS displays with optical separation"""
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        
-        aspect = self.eye_width / self.height
-        
         # Simple symmetric perspective - same for both eyes
-        gluPerspective(self.fov, aspect, self.near, self.far)
-        
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        
-        # The ONLY difference between eyes: camera X position
-        # Left eye is at -IPD/2, right eye at +IPD/2
-        # Looking at same point creates natural convergence
-        eye_x = -self.ipd / 2 if eye == 'left' else self.ipd / 2
-        
-        # Camera position offset (parallel cameras)
-        glTranslatef(-eye_x, 0, 0)
-    
-    def draw_cube(self, size):
-        s = size / 2
-        
-        glBegin(GL_QUADS)
-        # Front
-        glNormal3f(0, 0, 1)
-        glVertex3f(-s, -s, s); glVertex3f(s, -s, s)
-        glVertex3f(s, s, s); glVertex3f(-s, s, s)
-        # Back
-        glNormal3f(0, 0, -1)
-        glVertex3f(s, -s, -s); glVertex3f(-s, -s, -s)
-        glVertex3f(-s, s, -s); glVertex3f(s, s, -s)
-        # Left
-        glNormal3f(-1, 0, 0)
-        glVertex3f(-s, -s, -s); glVertex3f(-s, -s, s)
-        glVertex3f(-s, s, s); glVertex3f(-s, s, -s)
-        # Right
-        glNormal3f(1, 0, 0)
-        glVertex3f(s, -s, s); glVertex3f(s, -s, -s)
-        glVertex3f(s, s, -s); glVertex3f(s, s, s)
-        # Top
-        glNormal3f(0, 1, 0)
-        glVertex3f(-s, s, s); glVertex3f(s, s, s)
-        glVertex3f(s, s, -s); glVertex3f(-s, s, -s)
-        # Bottom
-        glNormal3f(0, -1, 0)
-        glVertex3f(-s, -s, -s); glVertex3f(s, -s, -s)
-        glVertex3f(s, -s, s); glVertex3f(-s, -s, s)
-        glEnd()
+        projection = self.projection()
+        
+        # Per-eye matrices only depend on the projection and the IPD
+        if self.ipd != self._eye_ipd:
+            self._eye_view_projs.clear()
+            self._eye_ipd = self.ipd
+        view_proj = self._eye_view_projs.get(eye)
+        if view_proj is None:
+            # The ONLY difference between eyes: camera X position
+            # Left eye is at -IPD/2, right eye at +IPD/2
+            # Looking at same point creates natural convergence
+            eye_x = -self.ipd / 2 if eye == 'left' else self.ipd / 2
+            
+            # Camera position offset (parallel cameras)
+            view_proj = projection @ translation(-eye_x, 0, 0)
+            self._eye_view_projs[eye] = view_proj
+        self.eye_view_proj = view_proj
+    
+    def draw_cube(self, mvp, color, draw_edges=True):
+        """Draw a unit cube with the mesh program bound; mvp includes the cube's scale"""
+        self._set_mvp(self.mesh_mvp, mvp)
+        glVertexAttrib4f(ATTRIB_COLOR, color[0], color[1], color[2], 1.0)
+        glBindVertexArray(self.cube_vao)
+        glDrawArrays(GL_TRIANGLES, 0, self.cube_vertex_count)
+        if not draw_edges:
+            return
         
         # Edges for depth perception
-        glColor3f(1, 1, 1)
+        glVertexAttrib4f(ATTRIB_COLOR, 1, 1, 1, 1)
         glLineWidth(1.5)
-        glBegin(GL_LINES)
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                glVertex3f(i*s, j*s, -s); glVertex3f(i*s, j*s, s)
-                glVertex3f(i*s, -s, j*s); glVertex3f(i*s, s, j*s)
-                glVertex3f(-s, i*s, j*s); glVertex3f(s, i*s, j*s)
-        glEnd()
-    
-    def draw_starfield(self):
+        glBindVertexArray(self.cube_edge_vao)
+        glDrawArrays(GL_LINES, 0, self.cube_edge_count)
+    
+    def star_resets(self, n):
+        """Next n (x, y, speed) rows from the pre-drawn star reset pool, refilled when exhausted"""
+        if self._reset_i + n > len(self._reset_pool):
+            self._reset_pool = self._rng.uniform(STAR_RESET_LOW, STAR_RESET_HIGH,
+                                                 (STAR_RESET_POOL, 3)).astype(np.float32)
+            self._reset_i = 0
+        resets = self._reset_pool[self._reset_i:self._reset_i + n]
+        self._reset_i += n
+        return resets
+    
+    def update_scene(self, dt, time_s):
+        """Advance the simulation by dt; touches Python/NumPy state only, no GL calls"""
+        self.scene_time = time_s
+        
+        stars = self.stars
+        stars['z'] -= stars['speed'] * (dt * 30)
+        expired = stars['z'] < 1
+        n = np.count_nonzero(expired)
+        if n:
+            resets = self.star_resets(n)
+            stars['x'][expired] = resets[:, 0]
+            stars['y'][expired] = resets[:, 1]
+            stars['z'][expired] = 100
+            stars['speed'][expired] = resets[:, 2]
+        
+        self.objects.update(dt, time_s)
+    
+    def upload_starfield(self):
+        """Stream the projected star positions/colors to the GPU, once per frame"""
+        stars = self.stars
+        
+        # Back-to-front order, so near stars land on top of far ones
+        order = np.argsort(stars['z'])[::-1]
+        x, y, z = stars['x'][order], stars['y'][order], stars['z'][order]
+        
+        # Project to screen
+        scale = 50.0 / z
+        self.star_pos[:, 0] = x * scale
+        self.star_pos[:, 1] = y * scale
+        self.star_pos[:, 2] = -z
+        
+        # Fade based on distance
+        brightness = 1.0 - z / 100.0
+        self.star_col[:, 0] = brightness
+        self.star_col[:, 1] = brightness
+        self.star_col[:, 2] = brightness * 1.1
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.star_vbo_pos)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.star_pos.nbytes, self.star_pos)
+        glBindBuffer(GL_ARRAY_BUFFER, self.star_vbo_col)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.star_col.nbytes, self.star_col)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    def update_model_matrices(self):
+        """Compose the floating objects' and the ring's model matrices for this frame"""
+        time_s = self.scene_time
+        self.object_models = self.objects.model_matrices()
+        # The outer ring of cubes turns as a whole
+        self.ring_model = (translation(0, 0, -25)
+                           @ rotation_y(time_s * 20)
+                           @ rotation_x(time_s * 10)
+                           @ rotation_y(-time_s * 30))
+    
+    def upload_ring(self):
+        """Bake the 8 spinning, colored ring cubes into the ring VBOs, once per frame"""
+        time_s = self.scene_time
+        # The ring's turn is undone per cube so each tumbles about (1, 1, 0) in the ring's parent frame
+        tumble = rotation_matrices(np.arange(8) * 45 + time_s * 80, (1, 1, 0))
+        rotations = rotation_matrices([time_s * 30], (0, 1, 0)) @ tumble
+        
+        self.ring_verts[:, :, :3] = self.ring_cube @ rotations.transpose(0, 2, 1) + self.ring_centers[:, None]
+        
+        # Rainbow colors
+        hues = (np.arange(8) / 8.0 + time_s * 0.1) % 1.0
+        self.ring_verts[:, :, 3:] = self.rainbow[(hues * 256).astype(np.int32) & 255][:, None]
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.ring_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.ring_verts.nbytes, self.ring_verts)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    def draw_ring(self, mvp, visible):
+        """Draw the visible ring cubes (a boolean mask) with one call; too far away for edges"""
+        count = np.count_nonzero(visible)
+        if not count:
+            return
+        
+        self._set_mvp(self.mesh_mvp, mvp)
+        glBindVertexArray(self.ring_vao)
+        glMultiDrawArrays(GL_TRIANGLES, self.ring_firsts[visible], self.ring_counts[visible], count)
+    
+    def draw_starfield(self, view_proj):
         glDisable(GL_DEPTH_TEST)
-        glPointSize(2.0)
-        glBegin(GL_POINTS)
-        for star in self.stars:
-            # Fade based on distance
-            brightness = 1.0 - (star.z / 100.0)
-            glColor3f(brightness, brightness, brightness * 1.1)
-            
-            # Project to screen
-            scale = 50.0 / star.z
-            sx = star.x * scale
-            sy = star.y * scale
-            glVertex3f(sx, sy, -star.z)
-        glEnd()
+        
+        glUseProgram(self.point_program)
+        self._set_mvp(self.point_mvp, view_proj)
+        glBindVertexArray(self.star_vao)
+        glDrawArrays(GL_POINTS, 0, self.num_stars)
+        
         glEnable(GL_DEPTH_TEST)
     
-    def draw_floor_grid(self):
+    def draw_floor_grid(self, view_proj):
         glDisable(GL_DEPTH_TEST)
+        glEnable(GL_BLEND)
         glLineWidth(1.0)
-        glBegin(GL_LINES)
-        
-        # Grid on the floor
-        y = -5
-        for i in range(-20, 21, 2):
-            # Fade with distance
-            alpha = max(0, 1.0 - abs(i) / 25.0)
-            glColor4f(0.2, 0.4, 0.6, alpha * 0.5)
-            glVertex3f(i, y, -5)
-            glVertex3f(i, y, -100)
-            
-        for z in range(-100, 0, 5):
-            alpha = max(0, 1.0 - abs(z) / 100.0)
-            glColor4f(0.2, 0.4, 0.6, alpha * 0.5)
-            glVertex3f(-20, y, z)
-            glVertex3f(20, y, z)
         
-        glEnd()
+        glUseProgram(self.mesh_program)
+        self._set_mvp(self.mesh_mvp, view_proj)
+        glBindVertexArray(self.grid_vao)
+        glDrawArrays(GL_LINES, 0, self.grid_vertex_count)
+        
+        glDisable(GL_BLEND)
         glEnable(GL_DEPTH_TEST)
     
-    def render_scene(self, time_s, dt):
-        # Update stars
-        for star in self.stars:
-            star.update(dt)
+    def draw_scene(self):
+        """Draw the current scene state for the eye set up by set_stereo_projection"""
+        view_proj = self.eye_view_proj
         
         # Draw starfield (background)
-        self.draw_starfield()
+        self.draw_starfield(view_proj)
         
         # Draw floor grid
-        self.draw_floor_grid()
+        self.draw_floor_grid(view_proj)
         
-        # Draw floating objects
-        for obj in self.objects:
-            obj.update(dt, time_s)
-            
-            glPushMatrix()
-            glTranslatef(obj.x, obj.y + obj.y_offset, -obj.z)
-            glRotatef(obj.rot_x, 1, 0, 0)
-            glRotatef(obj.rot_y, 0, 1, 0)
-            
-            glColor3f(*obj.color)
-            self.draw_cube(obj.size)
-            
-            glPopMatrix()
+        # Draw floating objects, skipping those outside this eye's frustum
+        glUseProgram(self.mesh_program)
+        objs = self.objects
+        models = self.object_models
+        centers = models[:, :3, 3]
+        visible = spheres_in_frustum(frustum_planes(view_proj), centers, objs.size[:len(objs)] * CUBE_RADIUS)
+        for i, mvp in zip(np.flatnonzero(visible), view_proj @ models[visible]):
+            self.draw_cube(mvp, objs.color[i], draw_edges=objs.z[i] < EDGE_MAX_DISTANCE)
         
         # Draw central rotating structure
-        glPushMatrix()
-        glTranslatef(0, 0, -25)
-        glRotatef(time_s * 20, 0, 1, 0)
-        glRotatef(time_s * 10, 1, 0, 0)
-        
-        # Outer ring of cubes
-        for i in range(8):
-            angle = i * 45 + time_s * 30
-            r = 5
-            x = math.cos(math.radians(angle)) * r
-            z = math.sin(math.radians(angle)) * r
-            
-            glPushMatrix()
-            glTranslatef(x, 0, z)
-            glRotatef(angle + time_s * 50, 1, 1, 0)
-            
-            # Rainbow colors
-            hue = (i / 8.0 + time_s * 0.1) % 1.0
-            r, g, b = self.hsv_to_rgb(hue, 0.8, 1.0)
-            glColor3f(r, g, b)
-            
-            self.draw_cube(0.8)
-            glPopMatrix()
+        ring_mvp = view_proj @ self.ring_model
+        self.draw_ring(ring_mvp, spheres_in_frustum(frustum_planes(ring_mvp), self.ring_centers, self.ring_radii))
         
-        glPopMatrix()
+        glBindVertexArray(0)
     
     def hsv_to_rgb(self, h, s, v):
         if s == 0.0:
@@ -339,46 +704,79 @@ class Demo3DScene:
         if i == 4: return t, p, v
         if i == 5: return v, p, q
     
-    def render_frame(self, time_s, dt):
+    def render_frame(self):
+        # Stars, ring and model matrices are shared by both eyes, build them once per frame
+        self.upload_starfield()
+        self.upload_ring()
+        self.update_model_matrices()
+        
+        # One clear for both eyes, the scissor only keeps each eye's draws in its half
+        self.time_gpu('clear')
+        glViewport(0, 0, self.width, self.height)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glEnable(GL_SCISSOR_TEST)
         
         # Left eye
+        self.time_gpu('draw_left')
         glViewport(0, 0, self.eye_width, self.height)
         glScissor(0, 0, self.eye_width, self.height)
-        glClearColor(0.0, 0.0, 0.02, 1.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         self.set_stereo_projection('left')
-        glPushMatrix()
-        self.render_scene(time_s, dt)
-        glPopMatrix()
+        self.draw_scene()
         
         # Right eye
+        self.time_gpu('draw_right')
         glViewport(self.eye_width, 0, self.eye_width, self.height)
         glScissor(self.eye_width, 0, self.eye_width, self.height)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         self.set_stereo_projection('right')
-        glPushMatrix()
-        self.render_scene(time_s, dt)
-        glPopMatrix()
+        self.draw_scene()
+        self.time_gpu(None)
         
         glDisable(GL_SCISSOR_TEST)
         sdl2.SDL_GL_SwapWindow(self.window)
     
+    def time_gpu(self, stage):
+        """With VITURE_PROFILE=1, end the running GL_TIME_ELAPSED query and start stage's (None stops)"""
+        if not self.profile:
+            return
+        if self.gpu_stage is not None:
+            glEndQuery(GL_TIME_ELAPSED)
+        if stage is not None:
+            glBeginQuery(GL_TIME_ELAPSED, self.gpu_queries[stage])
+        self.gpu_stage = stage
+    
+    def gpu_timings(self):
+        """Milliseconds spent on the GPU per stage in the last frame; waits for its queries"""
+        timings = {}
+        elapsed = ctypes.c_uint64()
+        for stage, query in self.gpu_queries.items():
+            glGetQueryObjectui64v(query, GL_QUERY_RESULT, ctypes.byref(elapsed))
+            timings[stage] = elapsed.value / 1e6
+        return timings
+    
     def handle_events(self):
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(ctypes.byref(event)) != 0:
-            if event.type == sdl2.SDL_QUIT:
+        sdl2.SDL_PumpEvents()
+        # Mouse motion is never used; drop it rather than copy it out
+        sdl2.SDL_FlushEvent(sdl2.SDL_MOUSEMOTION)
+        while True:
+            count = sdl2.SDL_PeepEvents(self.events, len(self.events), sdl2.SDL_GETEVENT,
+                                        sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+            for event in self.events[:max(count, 0)]:
+                self.handle_event(event)
+            if count < len(self.events):
+                break
+    
+    def handle_event(self, event):
+        if event.type == sdl2.SDL_QUIT:
+            self.running = False
+        elif event.type == sdl2.SDL_KEYDOWN:
+            if event.key.keysym.sym in (sdl2.SDLK_ESCAPE, sdl2.SDLK_q):
                 self.running = False
-            elif event.type == sdl2.SDL_KEYDOWN:
-                if event.key.keysym.sym in (sdl2.SDLK_ESCAPE, sdl2.SDLK_q):
-                    self.running = False
-                elif event.key.keysym.sym == sdl2.SDLK_PLUS or event.key.keysym.sym == sdl2.SDLK_EQUALS:
-                    self.ipd += 0.005
-                    print(f"IPD: {self.ipd*1000:.1f}mm")
-                elif event.key.keysym.sym == sdl2.SDLK_MINUS:
-                    self.ipd = max(0.02, self.ipd - 0.005)
-                    print(f"IPD: {self.ipd*1000:.1f}mm")
+            elif event.key.keysym.sym == sdl2.SDLK_PLUS or event.key.keysym.sym == sdl2.SDLK_EQUALS:
+                self.ipd += 0.005
+                print(f"IPD: {self.ipd*1000:.1f}mm")
+            elif event.key.keysym.sym == sdl2.SDLK_MINUS:
+                self.ipd = max(0.02, self.ipd - 0.005)
+                print(f"IPD: {self.ipd*1000:.1f}mm")
     
     def run(self):
         print("\n🎮 Viture 3D Demo")
@@ -391,20 +789,32 @@ class Demo3DScene:
         last_time = start_time
         frame_count = 0
         fps_time = start_time
+        sim_time = 0.0
+        accumulator = 0.0
         
         while self.running:
             self.handle_events()
             
             current_time = time.time()
-            dt = current_time - last_time
+            # Clamp long stalls so the simulation doesn't try to catch up all at once
+            accumulator += min(current_time - last_time, MAX_FRAME_TIME)
             last_time = current_time
             
-            self.render_frame(current_time - start_time, dt)
+            # Fixed-step simulation, independent of how long rendering takes
+            while accumulator >= SIM_DT:
+                sim_time += SIM_DT
+                self.update_scene(SIM_DT, sim_time)
+                accumulator -= SIM_DT
+            
+            self.render_frame()
             
             frame_count += 1
             if current_time - fps_time >= 1.0:
                 fps = frame_count / (current_time - fps_time)
-                print(f"\rFPS: {fps:.1f}  IPD: {self.ipd*1000:.1f}mm", end='', flush=True)
+                stats = f"FPS: {fps:.1f}  IPD: {self.ipd*1000:.1f}mm"
+                if self.profile:
+                    stats += "".join(f"  {stage}={ms:.2f}ms" for stage, ms in self.gpu_timings().items())
+                print(f"\r{stats}", end='', flush=True)
                 frame_count = 0
                 fps_time = current_time
         
@@ -7,16 +7,25 @@ bypassing the desktop compositor for minimal latency.
 
 Usage:
     python viture_direct_gl.py [--test-pattern] [--sbs-demo]
+
+Optional: pip install PyOpenGL PyOpenGL_accelerate
 """
 
 import os
 import sys
+import glob
+import functools
 import ctypes
 import ctypes.util
 from ctypes import c_void_p, c_int, c_uint, c_char_p, POINTER, Structure, byref
 
 # Try to use PyOpenGL if available, otherwise raw ctypes
 try:
+    import OpenGL
+    # Skip per-call glGetError and argument checks; set before importing OpenGL.GL
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
     from OpenGL import GL
     from OpenGL.GL import *
     HAVE_PYOPENGL = True
@@ -86,18 +95,52 @@ class drmModeConnector(Structure):
 DRM_MODE_CONNECTOR_HDMIA = 11
 DRM_MODE_CONNECTOR_HDMIB = 12
 
+AMD_VENDOR_ID = "0x1002"
+
+_LIBDRM = None
+
+def _get_libdrm():
+    """Load libdrm once and register the function signatures we use"""
+    global _LIBDRM
+    if _LIBDRM is None:
+        libdrm_path = ctypes.util.find_library("drm")
+        if not libdrm_path:
+            return None
+        
+        libdrm = ctypes.CDLL(libdrm_path)
+        
+        libdrm.drmModeGetResources.argtypes = [c_int]
+        libdrm.drmModeGetResources.restype = POINTER(drmModeRes)
+        
+        libdrm.drmModeGetConnector.argtypes = [c_int, c_uint]
+        libdrm.drmModeGetConnector.restype = POINTER(drmModeConnector)
+        
+        libdrm.drmModeFreeResources.argtypes = [POINTER(drmModeRes)]
+        libdrm.drmModeFreeConnector.argtypes = [POINTER(drmModeConnector)]
+        
+        _LIBDRM = libdrm
+    return _LIBDRM
+
+def _read_vendor(card_name):
+    """Read the PCI vendor id of a DRM card from sysfs, e.g. "0x1002" """
+    try:
+        with open(f"/sys/class/drm/{card_name}/device/vendor") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=None)
 def find_drm_device():
     """Find the DRM device with HDMI output (AMD card)"""
-    for card_num in range(10):
-        card_path = f"/dev/dri/card{card_num}"
-        if os.path.exists(card_path):
-            # Check if it's the AMD card with HDMI
-            sysfs_path = f"/sys/class/drm/card{card_num}/device/vendor"
-            if os.path.exists(sysfs_path):
-                with open(sysfs_path) as f:
-                    vendor = f.read().strip()
-                    if vendor == "0x1002":  # AMD
-                        return card_path
+    cards = []
+    for card_path in glob.glob("/dev/dri/card*"):
+        card_name = os.path.basename(card_path)
+        number = card_name[len("card"):]
+        if number.isdigit():
+            cards.append((int(number), card_name, card_path))
+    for _, card_name, card_path in sorted(cards):
+        if _read_vendor(card_name) == AMD_VENDOR_ID:
+            return card_path
     return None
 
 def main():
@@ -117,23 +160,11 @@ def main():
     print(f"Found AMD card: {card_path}")
     
     # Load libdrm
-    libdrm_path = ctypes.util.find_library("drm")
-    if not libdrm_path:
+    libdrm = _get_libdrm()
+    if not libdrm:
         print("ERROR: libdrm not found. Install with: sudo zypper install libdrm-devel")
         sys.exit(1)
     
-    libdrm = ctypes.CDLL(libdrm_path)
-    
-    # Setup function signatures
-    libdrm.drmModeGetResources.argtypes = [c_int]
-    libdrm.drmModeGetResources.restype = POINTER(drmModeRes)
-    
-    libdrm.drmModeGetConnector.argtypes = [c_int, c_uint]
-    libdrm.drmModeGetConnector.restype = POINTER(drmModeConnector)
-    
-    libdrm.drmModeFreeResources.argtypes = [POINTER(drmModeRes)]
-    libdrm.drmModeFreeConnector.argtypes = [POINTER(drmModeConnector)]
-    
     # Open DRM device
     fd = os.open(card_path, os.O_RDWR)
     print(f"Opened DRM device fd={fd}")
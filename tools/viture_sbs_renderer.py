@@ -6,7 +6,7 @@ Renders stereo 3D content directly to Viture glasses using SDL2+OpenGL.
 The display is positioned outside the main desktop area.
 
 Requirements:
-    pip install PyOpenGL PySDL2
+    pip install PyOpenGL PyOpenGL_accelerate PySDL2 numpy
 
 Usage:
     python viture_sbs_renderer.py --test      # Test pattern
@@ -18,26 +18,77 @@ import os
 import math
 import time
 import ctypes
-import subprocess
+import threading
+import collections
+
+class XRRMonitorInfo(ctypes.Structure):
+    """XRRMonitorInfo from X11/extensions/Xrandr.h"""
+    _fields_ = [
+        ("name", ctypes.c_ulong),  # Atom
+        ("primary", ctypes.c_int),
+        ("automatic", ctypes.c_int),
+        ("noutput", ctypes.c_int),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("mwidth", ctypes.c_int),
+        ("mheight", ctypes.c_int),
+        ("outputs", ctypes.POINTER(ctypes.c_ulong)),  # RROutput *
+    ]
+
 
 def get_viture_position():
-    """Get Viture display position from xrandr"""
+    """Get Viture display position from the X server's RandR monitors (same list as xrandr --listmonitors)"""
     try:
-        result = subprocess.run(['xrandr', '--listmonitors'], capture_output=True, text=True)
-        for line in result.stdout.split('\n'):
-            if 'HDMI-1' in line or 'HDMI-A-1' in line:
-                # Parse: " 1: +HDMI-1 3840/600x1080/340+2560+0  HDMI-1"
-                import re
-                match = re.search(r'\+(\d+)\+(\d+)', line)
-                if match:
-                    x, y = int(match.group(1)), int(match.group(2))
-                    print(f"Found Viture at position ({x}, {y})")
-                    return x, y
-    except Exception as e:
-        print(f"Warning: Could not get xrandr info: {e}")
+        xlib = ctypes.CDLL("libX11.so.6")
+        xrandr = ctypes.CDLL("libXrandr.so.2")
+    except OSError as e:
+        print(f"Warning: Could not load Xlib/Xrandr: {e}")
+        return 2560, 0  # Default fallback
+    
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+    xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+    xlib.XGetAtomName.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xlib.XGetAtomName.restype = ctypes.c_void_p  # char *, freed with XFree
+    xlib.XFree.argtypes = [ctypes.c_void_p]
+    xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    xrandr.XRRGetMonitors.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int,
+                                      ctypes.POINTER(ctypes.c_int)]
+    xrandr.XRRGetMonitors.restype = ctypes.POINTER(XRRMonitorInfo)
+    xrandr.XRRFreeMonitors.argtypes = [ctypes.POINTER(XRRMonitorInfo)]
+    
+    display = xlib.XOpenDisplay(None)
+    if not display:
+        print("Warning: Could not open X display")
+        return 2560, 0
+    
+    try:
+        count = ctypes.c_int()
+        monitors = xrandr.XRRGetMonitors(display, xlib.XDefaultRootWindow(display), True,
+                                         ctypes.byref(count))
+        if not monitors:
+            print("Warning: Could not get RandR monitors")
+            return 2560, 0
+        try:
+            for monitor in monitors[:count.value]:
+                name_ptr = xlib.XGetAtomName(display, monitor.name)
+                if not name_ptr:
+                    continue
+                name = ctypes.string_at(name_ptr).decode()
+                xlib.XFree(name_ptr)
+                if 'HDMI-1' in name or 'HDMI-A-1' in name:
+                    print(f"Found Viture at position ({monitor.x}, {monitor.y})")
+                    return monitor.x, monitor.y
+        finally:
+            xrandr.XRRFreeMonitors(monitors)
+    finally:
+        xlib.XCloseDisplay(display)
     return 2560, 0  # Default fallback
 
-# Get actual position from xrandr
+# Get actual position from RandR
 VITURE_X, VITURE_Y = get_viture_position()
 os.environ['SDL_VIDEO_WINDOW_POS'] = f'{VITURE_X},{VITURE_Y}'
 
@@ -51,12 +102,147 @@ except ImportError:
     sys.exit(1)
 
 try:
+    import OpenGL
+    # Vertex data must already be contiguous NumPy arrays; raise instead of silently converting
+    OpenGL.ERROR_ON_COPY = True
     from OpenGL.GL import *
-    from OpenGL.GLU import *
 except ImportError:
     print("PyOpenGL not found. Install with: pip install PyOpenGL PyOpenGL_accelerate")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("NumPy not found. Install with: pip install numpy")
+    sys.exit(1)
+
+
+def build_cube_vertices():
+    """Unit cube as 24 interleaved (x, y, z, r, g, b) vertices, 4 per face with the face's color"""
+    s = 0.5
+    faces = [
+        ((1, 0, 0), [(-s, -s, s), (s, -s, s), (s, s, s), (-s, s, s)]),      # Front (red)
+        ((0, 1, 0), [(s, -s, -s), (-s, -s, -s), (-s, s, -s), (s, s, -s)]),  # Back (green)
+        ((0, 0, 1), [(-s, -s, -s), (-s, -s, s), (-s, s, s), (-s, s, -s)]),  # Left (blue)
+        ((1, 1, 0), [(s, -s, s), (s, -s, -s), (s, s, -s), (s, s, s)]),      # Right (yellow)
+        ((0, 1, 1), [(-s, s, s), (s, s, s), (s, s, -s), (-s, s, -s)]),      # Top (cyan)
+        ((1, 0, 1), [(-s, -s, -s), (s, -s, -s), (s, -s, s), (-s, -s, s)]),  # Bottom (magenta)
+    ]
+    return np.array([v + color for color, quad in faces for v in quad], dtype=np.float32)
+
+
+def build_cube_indices():
+    """GL_TRIANGLES indices for build_cube_vertices, two counter-clockwise triangles per face"""
+    # Faces don't share vertices because each has its own color; without per-face colors
+    # the cube could shrink to 8 unique positions and let the GPU vertex cache reuse them
+    return np.array([4 * face + i for face in range(6) for i in (0, 1, 2, 0, 2, 3)], dtype=np.uint8)
+
+
+def build_test_pattern_lines():
+    """Test pattern GL_LINES as interleaved (x, y, r, g, b) in the unit square: grid first, then the center cross"""
+    white, red = (1, 1, 1), (1, 0, 0)
+    grid = [((i / 10.0, 0), (i / 10.0, 1)) for i in range(11)]  # Vertical lines
+    grid += [((0, i / 6.0), (1, i / 6.0)) for i in range(7)]    # Horizontal lines
+    cross = [((0.4, 0.5), (0.6, 0.5)), ((0.5, 0.4), (0.5, 0.6))]
+    lines = [p + white for line in grid for p in line] + [p + red for line in cross for p in line]
+    return np.array(lines, dtype=np.float32), 2 * len(grid), 2 * len(cross)
+
+
+def frustum(left, right, bottom, top, near, far):
+    """Row-major 4x4 perspective frustum, same as glFrustum"""
+    return np.array([
+        [2 * near / (right - left), 0, (right + left) / (right - left), 0],
+        [0, 2 * near / (top - bottom), (top + bottom) / (top - bottom), 0],
+        [0, 0, -(far + near) / (far - near), -2 * far * near / (far - near)],
+        [0, 0, -1, 0],
+    ])
+
+
+def translation(x, y, z):
+    m = np.eye(4)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def compile_shader(kind, source):
+    shader = glCreateShader(kind)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        raise RuntimeError(f"Shader compilation failed: {glGetShaderInfoLog(shader).decode()}")
+    return shader
+
+
+def compile_program(vertex_source, fragment_source):
+    shaders = [compile_shader(GL_VERTEX_SHADER, vertex_source),
+               compile_shader(GL_FRAGMENT_SHADER, fragment_source)]
+    program = glCreateProgram()
+    for shader in shaders:
+        glAttachShader(program, shader)
+    glLinkProgram(program)
+    for shader in shaders:
+        glDeleteShader(shader)
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        raise RuntimeError(f"Shader link failed: {glGetProgramInfoLog(program).decode()}")
+    return program
+
+
+# Hot-loop SDL names bound once, so handle_events/render_frame skip the module lookups
+_SDL_QUIT = sdl2.SDL_QUIT
+_SDL_KEYDOWN = sdl2.SDL_KEYDOWN
+_QUIT_KEYS = frozenset({sdl2.SDLK_ESCAPE, sdl2.SDLK_q})
+_poll = sdl2.SDL_PollEvent
+_swap_window = sdl2.SDL_GL_SwapWindow
+_byref = ctypes.byref
+
+ATTRIB_POSITION = 0
+ATTRIB_COLOR = 1
+
+# Single-pass stereo: every draw is instanced twice, instance 0 is the left eye and 1 the right.
+# Each eye's clip position is squeezed into its half of the SBS viewport, and gl_ClipDistance
+# cuts whatever would spill over into the other eye's half.
+STEREO_VERTEX_SHADER = """
+#version 330 compatibility
+layout(std140) uniform StereoEyes {
+    mat4 WorldToEyeClipMatrix[2];
+    vec4 EyeClipEdge[2];
+    float EyeOffsetScale[2];
+};
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec3 aColor;
+out vec3 vColor;
+void main() {
+    int eyeIndex = gl_InstanceID & 1;
+    vec4 clipPos = WorldToEyeClipMatrix[eyeIndex] * gl_ModelViewMatrix * vec4(aPos, 1.0);
+    gl_ClipDistance[0] = dot(clipPos, EyeClipEdge[eyeIndex]);
+    clipPos.x *= 0.5;
+    clipPos.x += EyeOffsetScale[eyeIndex] * clipPos.w;
+    gl_Position = clipPos;
+    vColor = aColor;
+}
+"""
+
+STEREO_FRAGMENT_SHADER = """
+#version 330 compatibility
+in vec3 vColor;
+out vec4 fragColor;
+void main() {
+    fragColor = vec4(vColor, 1.0);
+}
+"""
+
+# Per eye: keep clip x <= w (left) or x >= -w (right), then shift into the left/right half
+EYE_CLIP_EDGES = ((-1, 0, 0, 1), (1, 0, 0, 1))
+EYE_OFFSET_SCALES = (-0.5, 0.5)
+
+SQRT_HALF = math.sqrt(0.5)  # Unit (1, 1, 0) rotation axis components
+
+# Test pattern backgrounds: red tint for left, blue tint for right
+LEFT_TINT = (0.3, 0.0, 0.0)
+RIGHT_TINT = (0.0, 0.0, 0.3)
+
+FPS_REPORT_FRAMES = 128
+
 
 class VitureRenderer:
     """Stereo renderer for Viture XR glasses"""
@@ -72,6 +258,22 @@ class VitureRenderer:
         self.far = 100.0
         self.fov = 45.0
         
+        # Frame invariants: viewport/scissor rectangles and the test pattern's
+        # glOrtho(0, 1, 0, 1, -1, 1) as a column-major matrix
+        self._full_rect = (0, 0, width, height)
+        self._eye_tints = (((0, 0, self.eye_width, height), LEFT_TINT),
+                           ((self.eye_width, 0, self.eye_width, height), RIGHT_TINT))
+        self._ortho = np.array([[2, 0, 0, 0], [0, 2, 0, 0], [0, 0, -1, 0], [-1, -1, 0, 1]],
+                               dtype=np.float32).ravel()
+        
+        # Column-major model matrix, rewritten in place by render_scene
+        self._model = np.zeros(16, np.float32)
+        self._model[14] = -5.0
+        self._model[15] = 1.0
+        
+        # Out-parameters reused by SDL queries (window position/size)
+        self._int_a, self._int_b = ctypes.c_int(), ctypes.c_int()
+        
         self._init_sdl()
         self._init_gl()
     
@@ -80,9 +282,9 @@ class VitureRenderer:
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
             raise RuntimeError(f"SDL_Init failed: {sdl2.SDL_GetError()}")
         
-        # OpenGL attributes - use compatibility profile for legacy functions
-        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MAJOR_VERSION, 2)
-        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MINOR_VERSION, 1)
+        # OpenGL attributes - 3.3 for instanced stereo, compatibility profile for legacy functions
+        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MAJOR_VERSION, 3)
+        sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_MINOR_VERSION, 3)
         sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_CONTEXT_PROFILE_MASK, 
                                   sdl2.SDL_GL_CONTEXT_PROFILE_COMPATIBILITY)
         sdl2.SDL_GL_SetAttribute(sdl2.SDL_GL_DOUBLEBUFFER, 1)
@@ -113,9 +315,12 @@ class VitureRenderer:
         # VSync
         sdl2.SDL_GL_SetSwapInterval(1)
         
+        # Reused by handle_events every frame
+        self._event = sdl2.SDL_Event()
+        
         # Verify actual position
-        actual_x, actual_y = ctypes.c_int(), ctypes.c_int()
-        sdl2.SDL_GetWindowPosition(self.window, ctypes.byref(actual_x), ctypes.byref(actual_y))
+        actual_x, actual_y = self._int_a, self._int_b
+        sdl2.SDL_GetWindowPosition(self.window, _byref(actual_x), _byref(actual_y))
         print(f"Window created: {self.width}x{self.height} at position ({actual_x.value},{actual_y.value})")
     
     def _init_gl(self):
@@ -125,15 +330,79 @@ class VitureRenderer:
         glDepthFunc(GL_LEQUAL)
         glEnable(GL_CULL_FACE)
         glCullFace(GL_BACK)
+        # Always on; render_frame only moves the rectangle
+        glEnable(GL_SCISSOR_TEST)
+        # Also always on: the stereo shader writes it, and for fixed-function draws it is
+        # user clip plane 0, whose default (0, 0, 0, 0) plane never clips anything
+        glEnable(GL_CLIP_DISTANCE0)
+        
+        # Only the test pattern uses the fixed-function projection and it never changes;
+        # the stereo shader takes its eye matrices from the StereoEyes block instead
+        glMatrixMode(GL_PROJECTION)
+        glLoadMatrixf(self._ortho)
+        glMatrixMode(GL_MODELVIEW)
+        
+        # Stereo program; both eye matrices live in one uniform block at binding 0
+        self.stereo_program = compile_program(STEREO_VERTEX_SHADER, STEREO_FRAGMENT_SHADER)
+        block = glGetUniformBlockIndex(self.stereo_program, b"StereoEyes")
+        glUniformBlockBinding(self.stereo_program, block, 0)
+        self.eye_data = np.zeros(48, np.float32)  # std140: 2 mat4, 2 vec4, 2 floats padded to vec4
+        self.eye_ubo = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self.eye_ubo)
+        glBufferData(GL_UNIFORM_BUFFER, self.eye_data.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        glBindBufferBase(GL_UNIFORM_BUFFER, 0, self.eye_ubo)
+        
+        # Static indexed cube geometry, uploaded once and drawn with a single instanced glDrawElements
+        cube, indices = build_cube_vertices(), build_cube_indices()
+        self.cube_index_count = len(indices)
+        self.cube_vbo, self.cube_ibo = glGenBuffers(2)
+        self.cube_vao = glGenVertexArrays(1)
+        glBindVertexArray(self.cube_vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.cube_vbo)
+        glBufferData(GL_ARRAY_BUFFER, cube.nbytes, cube, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.cube_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(ATTRIB_POSITION)
+        glVertexAttribPointer(ATTRIB_POSITION, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(ATTRIB_COLOR)
+        glVertexAttribPointer(ATTRIB_COLOR, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(12))
+        glBindVertexArray(0)
+        
+        # The eye matrices are constant, upload them once
+        self.set_projection()
+        
+        # Static test pattern, same for both eyes, compiled once into a display list.
+        # Client array state isn't recorded in lists, only the vertex data the draws read.
+        lines, grid_count, cross_count = build_test_pattern_lines()
+        pattern_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, pattern_vbo)
+        glBufferData(GL_ARRAY_BUFFER, lines.nbytes, lines, GL_STATIC_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 20, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, 20, ctypes.c_void_p(8))
+        
+        self.grid_list = glGenLists(1)
+        glNewList(self.grid_list, GL_COMPILE)
+        # Grid pattern
+        glLineWidth(2.0)
+        glDrawArrays(GL_LINES, 0, grid_count)
+        # Center cross
+        glLineWidth(4.0)
+        glDrawArrays(GL_LINES, grid_count, cross_count)
+        glEndList()
+        
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDeleteBuffers(1, np.array([pattern_vbo], np.uint32))
         
         print(f"OpenGL Version: {glGetString(GL_VERSION).decode()}")
         print(f"OpenGL Renderer: {glGetString(GL_RENDERER).decode()}")
     
-    def set_projection(self, eye='left'):
-        """Set up projection matrix for stereo rendering"""
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        
+    def eye_matrix(self, eye):
+        """World to clip matrix for one eye: asymmetric frustum and camera offset"""
         aspect = self.eye_width / self.height
         
         # Asymmetric frustum for stereo
@@ -145,190 +414,189 @@ class VitureRenderer:
         bottom = -top
         
         # Shift frustum for stereo
-        a = aspect * math.tan(math.radians(self.fov / 2)) * self.near
+        a = aspect * top
         b = a - eye_offset * (self.near / 1.0)  # 1.0 = convergence distance
         c = -a - eye_offset * (self.near / 1.0)
         
         left_f = c if eye == 'left' else -b
         right_f = b if eye == 'left' else -c
         
-        glFrustum(left_f, right_f, bottom, top, self.near, self.far)
-        
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        
         # Camera offset for stereo
-        glTranslatef(-eye_offset, 0, 0)
+        return frustum(left_f, right_f, bottom, top, self.near, self.far) @ translation(-eye_offset, 0, 0)
+    
+    def set_projection(self):
+        """Upload both eyes' stereo matrices to the StereoEyes block; rerun after changing ipd/fov/near/far"""
+        data = self.eye_data
+        data[0:16] = self.eye_matrix('left').T.ravel()  # GLSL matrices are column-major
+        data[16:32] = self.eye_matrix('right').T.ravel()
+        data[32:40] = np.ravel(EYE_CLIP_EDGES)
+        data[40::4] = EYE_OFFSET_SCALES
+        
+        glBindBuffer(GL_UNIFORM_BUFFER, self.eye_ubo)
+        glBufferSubData(GL_UNIFORM_BUFFER, 0, data.nbytes, data)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
     
     def render_scene(self, time_s):
-        """Override this to render your scene"""
-        # Default: rotating cube
-        glTranslatef(0, 0, -5)
-        glRotatef(time_s * 50, 1, 1, 0)
+        """Override this to render your scene.
+        
+        Called once per frame for both eyes, with the stereo program bound. Every draw must be
+        instanced twice (one instance per eye, see draw_stereo) and take its positions and colors
+        from ATTRIB_POSITION and ATTRIB_COLOR. A plain glDrawArrays or glBegin/glEnd only reaches
+        the left eye.
+        """
+        # Default: rotating cube, translate(0, 0, -5) @ rotate(time_s * 50, 1, 1, 0)
+        # written straight into the column-major model matrix
+        angle = math.radians(time_s * 50.0)
+        c, s = math.cos(angle), math.sin(angle)
+        k = s * SQRT_HALF
+        h = (1.0 - c) * 0.5
+        m = self._model
+        m[0], m[1], m[2] = h + c, h, -k
+        m[4], m[5], m[6] = h, h + c, k
+        m[8], m[9], m[10] = k, -k, c
+        glLoadMatrixf(m)
         self.draw_cube(1.0)
     
     def draw_cube(self, size):
-        """Draw a colored cube"""
-        s = size / 2
-        
-        glBegin(GL_QUADS)
-        
-        # Front (red)
-        glColor3f(1, 0, 0)
-        glVertex3f(-s, -s, s)
-        glVertex3f(s, -s, s)
-        glVertex3f(s, s, s)
-        glVertex3f(-s, s, s)
-        
-        # Back (green)
-        glColor3f(0, 1, 0)
-        glVertex3f(s, -s, -s)
-        glVertex3f(-s, -s, -s)
-        glVertex3f(-s, s, -s)
-        glVertex3f(s, s, -s)
-        
-        # Left (blue)
-        glColor3f(0, 0, 1)
-        glVertex3f(-s, -s, -s)
-        glVertex3f(-s, -s, s)
-        glVertex3f(-s, s, s)
-        glVertex3f(-s, s, -s)
-        
-        # Right (yellow)
-        glColor3f(1, 1, 0)
-        glVertex3f(s, -s, s)
-        glVertex3f(s, -s, -s)
-        glVertex3f(s, s, -s)
-        glVertex3f(s, s, s)
-        
-        # Top (cyan)
-        glColor3f(0, 1, 1)
-        glVertex3f(-s, s, s)
-        glVertex3f(s, s, s)
-        glVertex3f(s, s, -s)
-        glVertex3f(-s, s, -s)
-        
-        # Bottom (magenta)
-        glColor3f(1, 0, 1)
-        glVertex3f(-s, -s, -s)
-        glVertex3f(s, -s, -s)
-        glVertex3f(s, -s, s)
-        glVertex3f(-s, -s, s)
-        
-        glEnd()
-    
-    def draw_test_pattern(self):
-        """Draw a test pattern - different for each eye"""
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        glOrtho(0, 1, 0, 1, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        
-        # Grid pattern
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        
-        # Vertical lines
-        for i in range(11):
-            x = i / 10.0
-            glColor3f(1, 1, 1)
-            glVertex2f(x, 0)
-            glVertex2f(x, 1)
-        
-        # Horizontal lines
-        for i in range(7):
-            y = i / 6.0
-            glVertex2f(0, y)
-            glVertex2f(1, y)
+        """Draw a colored cube for both eyes"""
+        glPushMatrix()
+        glScalef(size, size, size)
         
-        glEnd()
+        self.draw_stereo(self.cube_vao, GL_TRIANGLES, self.cube_index_count, GL_UNSIGNED_BYTE)
         
-        # Center cross
-        glLineWidth(4.0)
-        glColor3f(1, 0, 0)
-        glBegin(GL_LINES)
-        glVertex2f(0.4, 0.5)
-        glVertex2f(0.6, 0.5)
-        glVertex2f(0.5, 0.4)
-        glVertex2f(0.5, 0.6)
-        glEnd()
+        glPopMatrix()
+    
+    def draw_stereo(self, vao, mode, count, index_type=None):
+        """Draw a VAO once per eye from render_scene; indexed when index_type is given"""
+        glBindVertexArray(vao)
+        if index_type is None:
+            glDrawArraysInstanced(mode, 0, count, 2)
+        else:
+            glDrawElementsInstanced(mode, count, index_type, None, 2)
+        glBindVertexArray(0)
+    
+    def draw_test_pattern(self, tint):
+        """Draw a test pattern over a background tint - different for each eye"""
+        glColor3f(*tint)
+        glRectf(0, 0, 1, 1)
+        glCallList(self.grid_list)
     
     def render_frame(self, time_s, test_pattern=False):
         """Render a complete stereo frame"""
-        # Clear entire screen first
-        glClearColor(0.0, 0.0, 0.1, 1.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        
-        # Enable scissor test for per-eye clear
-        glEnable(GL_SCISSOR_TEST)
-        
-        # Left eye (left half of screen)
-        glViewport(0, 0, self.eye_width, self.height)
-        glScissor(0, 0, self.eye_width, self.height)
-        if test_pattern:
-            glClearColor(0.3, 0.0, 0.0, 1.0)  # Red tint for left
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            self.draw_test_pattern()
-        else:
-            glClearColor(0.1, 0.0, 0.0, 1.0)
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            self.set_projection('left')
-            glPushMatrix()
-            self.render_scene(time_s)
-            glPopMatrix()
+        glLoadIdentity()
         
-        # Right eye (right half of screen)
-        glViewport(self.eye_width, 0, self.eye_width, self.height)
-        glScissor(self.eye_width, 0, self.eye_width, self.height)
         if test_pattern:
-            glClearColor(0.0, 0.0, 0.3, 1.0)  # Blue tint for right
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            self.draw_test_pattern()
+            # Flat 2D overlay: no depth, and the tint quads cover every pixel so nothing to clear
+            glDisable(GL_DEPTH_TEST)
+            # Scissor keeps each eye's edge grid lines out of the other half
+            for rect, tint in self._eye_tints:
+                glViewport(*rect)
+                glScissor(*rect)
+                self.draw_test_pattern(tint)
+            glScissor(*self._full_rect)
+            glEnable(GL_DEPTH_TEST)
         else:
-            glClearColor(0.0, 0.0, 0.1, 1.0)
+            # One clear for the whole SBS frame; the test pattern leaves the scissor at the full rect
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-            self.set_projection('right')
-            glPushMatrix()
+            
+            # Both eyes in one pass over the whole SBS viewport
+            glViewport(*self._full_rect)
+            glUseProgram(self.stereo_program)
             self.render_scene(time_s)
-            glPopMatrix()
+            glUseProgram(0)
         
-        glDisable(GL_SCISSOR_TEST)
-        sdl2.SDL_GL_SwapWindow(self.window)
+        # Drawn straight into the back buffer: the vsynced swap on the render thread already
+        # lets the GPU work through this frame while the next one is prepared, and an
+        # offscreen frame ring would add a full-frame blit
+        _swap_window(self.window)
     
     def handle_events(self):
         """Process SDL events"""
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(ctypes.byref(event)) != 0:
-            if event.type == sdl2.SDL_QUIT:
+        event = self._event
+        event_ref = _byref(event)
+        while _poll(event_ref) != 0:
+            if event.type == _SDL_QUIT:
                 self.running = False
-            elif event.type == sdl2.SDL_KEYDOWN:
-                if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
-                    self.running = False
-                elif event.key.keysym.sym == sdl2.SDLK_q:
+            elif event.type == _SDL_KEYDOWN:
+                if event.key.keysym.sym in _QUIT_KEYS:
                     self.running = False
     
+    def _render_loop(self):
+        """Render thread: owns the GL context and runs the commands posted by run()"""
+        sdl2.SDL_GL_MakeCurrent(self.window, self.gl_context)
+        commands = {'draw_frame': self.render_frame}
+        try:
+            while True:
+                self._commands_ready.wait()
+                self._commands_ready.clear()
+                while self._commands:
+                    command = self._commands.popleft()
+                    if command is None:
+                        return
+                    # Let the main thread prepare the next frame while this one draws
+                    self._slot_free.set()
+                    name, *args = command
+                    commands[name](*args)
+                    self.frames_drawn += 1
+        except Exception as e:
+            self._render_error = e
+        finally:
+            self.running = False
+            self._slot_free.set()
+            sdl2.SDL_GL_MakeCurrent(self.window, None)
+    
+    def _post(self, command):
+        self._commands.append(command)
+        self._commands_ready.set()
+    
     def run(self, test_pattern=False):
-        """Main render loop"""
+        """Main loop: events and timing here, GL submission and vsync waits on the render thread"""
         print("\nRendering to Viture glasses...")
         print("Press ESC or Q to quit")
         
-        start_time = time.time()
-        frame_count = 0
-        fps_time = start_time
-        
-        while self.running:
-            self.handle_events()
-            
-            current_time = time.time() - start_time
-            self.render_frame(current_time, test_pattern)
-            
-            frame_count += 1
-            if time.time() - fps_time >= 1.0:
-                fps = frame_count / (time.time() - fps_time)
-                print(f"\rFPS: {fps:.1f}", end='', flush=True)
-                frame_count = 0
-                fps_time = time.time()
+        # Hand the GL context over to the render thread
+        self._commands = collections.deque()
+        self._commands_ready = threading.Event()
+        self._slot_free = threading.Event()
+        self._slot_free.set()
+        self._render_error = None
+        self.frames_drawn = 0
+        sdl2.SDL_GL_MakeCurrent(self.window, None)
+        render_thread = threading.Thread(target=self._render_loop, name="viture-render")
+        render_thread.start()
+        
+        start_ns = time.monotonic_ns()
+        posted = 0
+        fps_frames = 0
+        fps_ns = start_ns
+        
+        try:
+            while self.running:
+                self.handle_events()
+                
+                # At most one frame queued ahead of the one being drawn
+                if not self._slot_free.wait(0.1):
+                    continue
+                self._slot_free.clear()
+                
+                now_ns = time.monotonic_ns()
+                self._post(('draw_frame', (now_ns - start_ns) * 1e-9, test_pattern))
+                posted += 1
+                
+                # FPS report every FPS_REPORT_FRAMES frames (~2 s at 60 Hz)
+                if posted % FPS_REPORT_FRAMES == 0:
+                    frames = self.frames_drawn
+                    fps = (frames - fps_frames) * 1e9 / (now_ns - fps_ns)
+                    print("\rFPS: %.1f" % fps, end='', flush=True)
+                    fps_frames = frames
+                    fps_ns = now_ns
+        finally:
+            self._post(None)
+            render_thread.join()
+            sdl2.SDL_GL_MakeCurrent(self.window, self.gl_context)
+        
+        if self._render_error is not None:
+            raise self._render_error
         
         print("\nShutting down...")
     